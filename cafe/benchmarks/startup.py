@@ -0,0 +1,112 @@
+"""Measure cold-start latency of each Cafe Lumiere service.
+
+For every service this reports the median over several fresh processes of:
+
+- import:  time to ``import app`` in a new interpreter
+- live:    time from launching ``python app.py`` until ``/livez`` answers 200
+- ready:   time from launching until ``/readyz`` answers 200 (needs the
+           service's dependencies to be reachable, otherwise reported as n/a)
+
+Services are launched exactly as their containers run them, on their usual
+ports, so stop any locally running copies first. Dependencies are configured
+through the usual environment variables (DB_HOST, ORDER_SERVICE_URL, ...).
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 order-service
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+CAFE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVICES = {
+    'order-service': 5001,
+    'kitchen-service': 5002,
+    'frontend': 5000,
+}
+
+IMPORT_SNIPPET = (
+    'import time; start = time.perf_counter(); import app; '
+    'print(time.perf_counter() - start)'
+)
+
+def measure_import(service_dir):
+    """Seconds spent importing the app module in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_SNIPPET],
+        cwd=service_dir, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+def probe(url):
+    """Return the HTTP status of url, or None if nothing is listening yet"""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError, TimeoutError):
+        return None
+
+def measure_boot(service_dir, port, ready_timeout):
+    """Launch the service once and time how long until it is live and ready"""
+    base_url = f'http://127.0.0.1:{port}'
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'app.py'],
+        cwd=service_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    live = ready = None
+    try:
+        while time.perf_counter() - start < ready_timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f'{os.path.basename(service_dir)} exited with code {process.returncode}')
+            if live is None and probe(f'{base_url}/livez') == 200:
+                live = time.perf_counter() - start
+            if live is not None and probe(f'{base_url}/readyz') == 200:
+                ready = time.perf_counter() - start
+                break
+            time.sleep(0.01)
+    finally:
+        process.terminate()
+        process.wait()
+    return live, ready
+
+def format_median(samples):
+    """Median in milliseconds, or n/a when no run produced a value"""
+    values = [s for s in samples if s is not None]
+    if not values:
+        return 'n/a'
+    return f'{statistics.median(values) * 1000:.0f} ms'
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure service cold-start latency.')
+    parser.add_argument('services', nargs='*', metavar='service',
+                        help=f"services to measure (default: all of {', '.join(SERVICES)})")
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per service (default: 5)')
+    parser.add_argument('--ready-timeout', type=float, default=10,
+                        help='seconds to wait for /readyz per run (default: 10)')
+    args = parser.parse_args()
+    for service in args.services:
+        if service not in SERVICES:
+            parser.error(f'unknown service: {service}')
+
+    print(f"{'service':<18}{'import':>10}{'live':>10}{'ready':>10}")
+    for service in args.services or SERVICES:
+        service_dir = os.path.join(CAFE_DIR, service)
+        imports, lives, readies = [], [], []
+        for _ in range(args.runs):
+            imports.append(measure_import(service_dir))
+            live, ready = measure_boot(service_dir, SERVICES[service], args.ready_timeout)
+            lives.append(live)
+            readies.append(ready)
+        print(f'{service:<18}{format_median(imports):>10}{format_median(lives):>10}{format_median(readies):>10}')
+
+if __name__ == '__main__':
+    main()
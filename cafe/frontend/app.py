@@ -1,8 +1,10 @@
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
-import requests
 import os
 
+# requests is the slowest import here and only the /api proxy routes use it, so
+# those routes import it locally; pages and /livez answer without loading it
+
 app = Flask(__name__)
 CORS(app)
 
@@ -76,6 +78,23 @@ def display():
     """Order status display board"""
     return render_template('display.html')
 
+@app.route('/livez', methods=['GET'])
+def livez():
+    """Liveness probe: the process is up and serving"""
+    return jsonify({'status': 'alive', 'service': 'frontend'}), 200
+
+@app.route('/readyz', methods=['GET'])
+@app.route('/health', methods=['GET'])
+def readyz():
+    """Readiness probe
+
+    Deliberately independent of order-service and kitchen-service: the pages
+    and menu are served locally and the /api proxy routes already report
+    upstream failures, so an upstream outage should not pull the UI out of
+    rotation.
+    """
+    return jsonify({'status': 'ready', 'service': 'frontend'}), 200
+
 @app.route('/api/menu', methods=['GET'])
 def get_menu():
     """Get menu items"""
@@ -85,6 +104,7 @@ def get_menu():
 def create_order():
     """Create new order"""
     try:
+        import requests
         data = request.json
         response = requests.post(f'{ORDER_SERVICE_URL}/orders', json=data)
         return jsonify(response.json()), response.status_code
@@ -96,6 +116,7 @@ def create_order():
 def get_orders():
     """Get all orders"""
     try:
+        import requests
         response = requests.get(f'{ORDER_SERVICE_URL}/orders')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -106,6 +127,7 @@ def get_orders():
 def get_order(order_number):
     """Get specific order"""
     try:
+        import requests
         response = requests.get(f'{ORDER_SERVICE_URL}/orders/{order_number}')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -116,6 +138,7 @@ def get_order(order_number):
 def get_kitchen_orders():
     """Get kitchen orders"""
     try:
+        import requests
         response = requests.get(f'{KITCHEN_SERVICE_URL}/kitchen/orders')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -126,6 +149,7 @@ def get_kitchen_orders():
 def start_order(order_number):
     """Start preparing order"""
     try:
+        import requests
         response = requests.post(f'{KITCHEN_SERVICE_URL}/kitchen/orders/{order_number}/start')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -136,6 +160,7 @@ def start_order(order_number):
 def ready_order(order_number):
     """Mark order as ready"""
     try:
+        import requests
         response = requests.post(f'{KITCHEN_SERVICE_URL}/kitchen/orders/{order_number}/ready')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -146,6 +171,7 @@ def ready_order(order_number):
 def serve_order(order_number):
     """Mark order as served"""
     try:
+        import requests
         response = requests.post(f'{KITCHEN_SERVICE_URL}/kitchen/orders/{order_number}/serve')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -156,6 +182,7 @@ def serve_order(order_number):
 def get_display_orders():
     """Get orders for display board (preparing and ready)"""
     try:
+        import requests
         response = requests.get(f'{KITCHEN_SERVICE_URL}/display/orders')
         return jsonify(response.json()), response.status_code
     except Exception as e:
@@ -173,4 +200,6 @@ def method_not_allowed(error):
     return jsonify({'error': 'Method not allowed'}), 405
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Debug mode (and its reloader, which re-imports the app in a second
+    # process) is opt-in via FLASK_DEBUG=1
+    app.run(host='0.0.0.0', port=5000)
@@ -4,12 +4,20 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import os
+import threading
+import time
 
 app = Flask(__name__)
 CORS(app)
 
 ORDER_SERVICE_URL = os.environ.get('ORDER_SERVICE_URL', 'http://order-service:5001')
 
+# How long a readiness result is reused before order-service is probed again
+READINESS_CACHE_TTL = float(os.environ.get('READINESS_CACHE_TTL', '3'))
+
+_readiness_lock = threading.Lock()
+_readiness_cache = {'checked_at': None, 'result': None}
+
 def get_requests_session():
     """Create a requests session with retry logic."""
     session = requests.Session()
@@ -25,19 +33,45 @@ def get_requests_session():
     session.mount('https://', adapter)
     return session
 
-@app.route('/health', methods=['GET'])
-def health():
-    """Health check endpoint."""
+def check_order_service():
+    """Probe order-service once, without retries."""
     try:
-        # Check if order service is reachable
-        session = get_requests_session()
-        response = session.get(f'{ORDER_SERVICE_URL}/health', timeout=5)
+        response = requests.get(f'{ORDER_SERVICE_URL}/health', timeout=2)
         if response.status_code == 200:
-            return jsonify({'status': 'healthy', 'order_service': 'connected'}), 200
-        else:
-            return jsonify({'status': 'unhealthy', 'order_service': 'unreachable'}), 503
-    except:
-        return jsonify({'status': 'healthy', 'order_service': 'pending'}), 200
+            return {'ready': True, 'order_service': 'connected'}
+        return {'ready': False, 'order_service': 'unhealthy'}
+    except Exception as e:
+        return {'ready': False, 'order_service': 'unreachable', 'error': str(e)}
+
+def get_readiness():
+    """Return the cached dependency status, refreshing it once the TTL expires."""
+    with _readiness_lock:
+        checked_at = _readiness_cache['checked_at']
+        if checked_at is None or time.monotonic() - checked_at >= READINESS_CACHE_TTL:
+            _readiness_cache['result'] = check_order_service()
+            _readiness_cache['checked_at'] = time.monotonic()
+        return _readiness_cache['result']
+
+@app.route('/livez', methods=['GET'])
+def livez():
+    """Liveness probe: the process is up and serving, no dependency checks."""
+    return jsonify({'status': 'alive', 'service': 'kitchen-service'}), 200
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness probe: cached order-service reachability."""
+    result = get_readiness()
+    body = {'status': 'ready' if result['ready'] else 'not ready', 'service': 'kitchen-service'}
+    body.update({k: v for k, v in result.items() if k != 'ready'})
+    return jsonify(body), 200 if result['ready'] else 503
+
+@app.route('/health', methods=['GET'])
+def health():
+    """Health check endpoint backed by the cached readiness status."""
+    result = get_readiness()
+    if result['ready']:
+        return jsonify({'status': 'healthy', 'order_service': 'connected'}), 200
+    return jsonify({'status': 'unhealthy', 'order_service': result['order_service']}), 503
 
 @app.route('/kitchen/orders', methods=['GET'])
 def get_kitchen_orders():
@@ -234,4 +268,6 @@ def method_not_allowed(error):
     return jsonify({'error': 'Method not allowed'}), 405
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5002, debug=True)
+    # Debug mode (and its reloader, which re-imports the app in a second
+    # process) is opt-in via FLASK_DEBUG=1
+    app.run(host='0.0.0.0', port=5002)
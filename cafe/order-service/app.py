@@ -1,88 +1,96 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import psycopg2
 from psycopg2.extras import RealDictCursor, Json
-import os
+from psycopg2 import errors
 from datetime import datetime
+import os
+import threading
 import time
-import json
+
+from db import get_db_connection
+from migrate import latest_version
 
 app = Flask(__name__)
 CORS(app)
 
-# Database configuration
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'port': os.getenv('DB_PORT', '5432'),
-    'database': os.getenv('DB_NAME', 'cafe_lumiere'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', 'postgres')
-}
-
-def get_db_connection():
-    """Create database connection with retry logic"""
-    max_retries = 10
-    retry_delay = 3
-    
-    for attempt in range(max_retries):
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            conn.set_session(autocommit=False)
-            return conn
-        except psycopg2.OperationalError as e:
-            if attempt < max_retries - 1:
-                print(f"Database connection failed, retrying in {retry_delay}s... ({attempt + 1}/{max_retries})")
-                print(f"Error: {e}")
-                time.sleep(retry_delay)
-            else:
-                print(f"Failed to connect to database after {max_retries} attempts")
-                raise
-
-def init_db():
-    """Initialize database tables"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    # Create orders table
-    cur.execute('''
-        CREATE TABLE IF NOT EXISTS orders (
-            id SERIAL PRIMARY KEY,
-            order_number VARCHAR(20) UNIQUE NOT NULL,
-            customer_name VARCHAR(100) NOT NULL,
-            items JSONB NOT NULL,
-            total_price DECIMAL(10, 2) NOT NULL,
-            status VARCHAR(20) DEFAULT 'ordered',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.commit()
-    cur.close()
-    conn.close()
-    print("Database initialized successfully")
+# Schema version shipped with this build; the pod only reports ready once the
+# database has been migrated at least this far (see migrate.py)
+SCHEMA_VERSION = latest_version()
 
-@app.route('/health', methods=['GET'])
-def health():
-    """Health check endpoint with database connectivity check"""
+# How long a readiness result is reused before the database is probed again
+READINESS_CACHE_TTL = float(os.getenv('READINESS_CACHE_TTL', '3'))
+
+_readiness_lock = threading.Lock()
+_readiness_cache = {'checked_at': None, 'result': None}
+
+def check_database():
+    """Probe database connectivity and schema version"""
+    conn = None
     try:
         conn = get_db_connection()
         cur = conn.cursor()
-        cur.execute('SELECT 1')
+        cur.execute('SELECT COALESCE(MAX(version), 0) FROM schema_migrations')
+        version = cur.fetchone()[0]
         cur.close()
-        conn.close()
+        if version < SCHEMA_VERSION:
+            return {
+                'ready': False,
+                'database': 'connected',
+                'schema_version': version,
+                'error': f'Schema at version {version}, expected {SCHEMA_VERSION}'
+            }
+        return {'ready': True, 'database': 'connected', 'schema_version': version}
+    except errors.UndefinedTable:
+        return {
+            'ready': False,
+            'database': 'connected',
+            'schema_version': 0,
+            'error': 'Migrations have not been applied'
+        }
+    except Exception as e:
+        return {'ready': False, 'database': 'disconnected', 'error': str(e)}
+    finally:
+        if conn is not None:
+            conn.close()
+
+def get_readiness():
+    """Return the cached dependency status, refreshing it once the TTL expires"""
+    with _readiness_lock:
+        checked_at = _readiness_cache['checked_at']
+        if checked_at is None or time.monotonic() - checked_at >= READINESS_CACHE_TTL:
+            _readiness_cache['result'] = check_database()
+            _readiness_cache['checked_at'] = time.monotonic()
+        return _readiness_cache['result']
+
+@app.route('/livez', methods=['GET'])
+def livez():
+    """Liveness probe: the process is up and serving, no dependency checks"""
+    return jsonify({'status': 'alive', 'service': 'order-service'}), 200
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness probe: cached database connectivity and schema version"""
+    result = get_readiness()
+    body = {'status': 'ready' if result['ready'] else 'not ready', 'service': 'order-service'}
+    body.update({k: v for k, v in result.items() if k != 'ready'})
+    return jsonify(body), 200 if result['ready'] else 503
+
+@app.route('/health', methods=['GET'])
+def health():
+    """Health check endpoint backed by the cached readiness status"""
+    result = get_readiness()
+    if result['ready']:
         return jsonify({
             'status': 'healthy', 
             'service': 'order-service',
             'database': 'connected'
         }), 200
-    except Exception as e:
-        return jsonify({
-            'status': 'unhealthy', 
-            'service': 'order-service',
-            'database': 'disconnected',
-            'error': str(e)
-        }), 503
+    return jsonify({
+        'status': 'unhealthy', 
+        'service': 'order-service',
+        'database': result['database'],
+        'error': result['error']
+    }), 503
 
 @app.route('/orders', methods=['POST'])
 def create_order():
@@ -240,5 +248,6 @@ def method_not_allowed(error):
     return jsonify({'error': 'Method not allowed'}), 405
 
 if __name__ == '__main__':
-    init_db()
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    # Debug mode (and its reloader, which re-imports the app in a second
+    # process) is opt-in via FLASK_DEBUG=1
+    app.run(host='0.0.0.0', port=5001)
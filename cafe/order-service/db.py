@@ -0,0 +1,34 @@
+import psycopg2
+import os
+import time
+
+# Database configuration
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': os.getenv('DB_PORT', '5432'),
+    'database': os.getenv('DB_NAME', 'cafe_lumiere'),
+    'user': os.getenv('DB_USER', 'postgres'),
+    'password': os.getenv('DB_PASSWORD', 'postgres'),
+    'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '3'))
+}
+
+def get_db_connection(max_retries=1, retry_delay=3):
+    """Create database connection, optionally retrying while the database starts.
+
+    Request handlers use the default single attempt so an unreachable database
+    fails fast instead of blocking a worker; only the migration runner waits.
+    """
+    for attempt in range(max_retries):
+        try:
+            conn = psycopg2.connect(**DB_CONFIG)
+            conn.set_session(autocommit=False)
+            return conn
+        except psycopg2.OperationalError as e:
+            if attempt < max_retries - 1:
+                print(f"Database connection failed, retrying in {retry_delay}s... ({attempt + 1}/{max_retries})")
+                print(f"Error: {e}")
+                time.sleep(retry_delay)
+            else:
+                if max_retries > 1:
+                    print(f"Failed to connect to database after {max_retries} attempts")
+                raise
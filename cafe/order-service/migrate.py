@@ -0,0 +1,87 @@
+"""Versioned schema migrations for the order service.
+
+Migrations are plain SQL files in ``migrations/`` named ``<version>_<name>.sql``.
+Each one is applied once, in version order, and recorded in the
+``schema_migrations`` table. Run this once per release (docker-compose
+``order-migrate`` service, Kubernetes ``order-service-migrate`` Job) rather
+than on every pod boot:
+
+    python migrate.py
+"""
+import os
+import re
+import sys
+
+from db import get_db_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE_RE = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+# Arbitrary key for pg_advisory_lock so concurrent runners apply migrations one at a time
+MIGRATION_LOCK_ID = 7301
+
+def discover_migrations():
+    """Return (version, name, path) for every migration file, sorted by version"""
+    migrations = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = MIGRATION_FILE_RE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(MIGRATIONS_DIR, filename)))
+    return sorted(migrations)
+
+def latest_version():
+    """Schema version this build of the service expects"""
+    migrations = discover_migrations()
+    return migrations[-1][0] if migrations else 0
+
+def migrate():
+    """Apply all pending migrations and return the resulting schema version"""
+    conn = get_db_connection(
+        max_retries=int(os.getenv('DB_CONNECT_RETRIES', '10')),
+        retry_delay=int(os.getenv('DB_CONNECT_RETRY_DELAY', '3'))
+    )
+    cur = conn.cursor()
+    try:
+        cur.execute('SELECT pg_advisory_lock(%s)', (MIGRATION_LOCK_ID,))
+        cur.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+
+        cur.execute('SELECT version FROM schema_migrations')
+        applied = {row[0] for row in cur.fetchall()}
+
+        for version, name, path in discover_migrations():
+            if version in applied:
+                continue
+            print(f"Applying migration {version:04d}_{name}")
+            with open(path) as f:
+                cur.execute(f.read())
+            cur.execute(
+                'INSERT INTO schema_migrations (version, name) VALUES (%s, %s)',
+                (version, name)
+            )
+            conn.commit()
+            applied.add(version)
+
+        current = max(applied, default=0)
+        print(f"Database schema at version {current}")
+        return current
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        # Closing the session also releases the advisory lock
+        cur.close()
+        conn.close()
+
+if __name__ == '__main__':
+    try:
+        migrate()
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
@@ -17,12 +17,31 @@ kubectl create ns $NAMESPACE || true
 # Install Postgres Helm chart (service will be cafe-lumiere-postgresql)
 helm upgrade --install cafe-lumiere-postgresql cafe/helm/postgresql -n $NAMESPACE
 
-# Apply app manifests (ConfigMap, Secrets, Deployments, Services)
+# Jobs are immutable; drop the previous migration run so this release's Job is created fresh
+kubectl -n $NAMESPACE delete job order-service-migrate --ignore-not-found
+
+# Apply app manifests (ConfigMap, Secrets, migration Job, Deployments, Services)
 kubectl apply -f cafe/k8s/deployments.yaml -n $NAMESPACE
 
 # Wait for Postgres StatefulSet to be ready
 kubectl -n $NAMESPACE rollout status statefulset/cafe-lumiere-postgresql --timeout=180s
 
+# Wait for schema migrations; order-service pods stay unready until they have run.
+# Poll for both outcomes so a failed migration is reported (with its logs) straight away.
+for _ in $(seq 1 90); do
+  MIGRATE_COMPLETE=$(kubectl -n $NAMESPACE get job order-service-migrate -o jsonpath='{.status.conditions[?(@.type=="Complete")].status}')
+  MIGRATE_FAILED=$(kubectl -n $NAMESPACE get job order-service-migrate -o jsonpath='{.status.conditions[?(@.type=="Failed")].status}')
+  if [ "$MIGRATE_COMPLETE" = "True" ] || [ "$MIGRATE_FAILED" = "True" ]; then
+    break
+  fi
+  sleep 2
+done
+if [ "$MIGRATE_COMPLETE" != "True" ]; then
+  echo "Schema migration did not complete (failed=${MIGRATE_FAILED:-unknown}). Migration logs:"
+  kubectl -n $NAMESPACE logs job/order-service-migrate --all-containers --tail=100 || true
+  exit 1
+fi
+
 # Wait for app deployments to roll out
 kubectl -n $NAMESPACE rollout status deployment/order-service --timeout=120s
 kubectl -n $NAMESPACE rollout status deployment/kitchen-service --timeout=120s
@@ -34,7 +53,7 @@ kubectl -n $NAMESPACE get svc
 
 # Verify order-service health (from control plane)
 ORDER_POD=$(kubectl -n $NAMESPACE get pod -l app=order-service -o jsonpath='{.items[0].metadata.name}')
-kubectl -n $NAMESPACE exec -it $ORDER_POD -- curl -sS http://localhost:5001/health || kubectl -n $NAMESPACE logs $ORDER_POD
+kubectl -n $NAMESPACE exec -it $ORDER_POD -- curl -sS http://localhost:5001/readyz || kubectl -n $NAMESPACE logs $ORDER_POD
 
 # Verify kitchen -> order connectivity (from a kitchen pod)
 KITCHEN_POD=$(kubectl -n $NAMESPACE get pod -l app=kitchen-service -o jsonpath='{.items[0].metadata.name}')